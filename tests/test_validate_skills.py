@@ -0,0 +1,204 @@
+"""Tests for validate_skills.py."""
+
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import yaml
+
+import validate_skills
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Lines that sit right at the edge of what the flat parser may accept
+TRICKY_LINES = [
+    'name: foo',
+    'name: foo\xa0',
+    'name:\xa0foo',
+    'version: 1.0.0　',
+    'version: 1.0.0\x0c',
+    'description: d\x0b',
+    'description: 　',
+    'description: a b',
+    'description: ﻿foo',
+    'description:',
+    'description: ',
+    'description: "quoted: colon"',
+    "description: 'single'",
+    "description: 'it''s'",
+    'description: "esc\\"aped"',
+    'description: a #comment',
+    'description: a#b',
+    'description: http://example.com',
+    'description: foo:',
+    'description: yes',
+    'description: ~',
+    'version: 1.0',
+    'version: 1.2.3.4',
+    'version: 1.2.3-rc.1',
+    'version: 2020-01-01',
+    'version: 2020-13-01',
+    'version: 12:30',
+    'version: .inf',
+    'version: 0x1F',
+    'on: x',
+    'name : foo',
+    'name:foo',
+    '  indented: x',
+    'name: é ü',
+    '# a comment',
+    '',
+]
+
+
+def _yaml_load(text, loader):
+    try:
+        return yaml.load(text, Loader=loader)
+    except (yaml.YAMLError, ValueError) as e:
+        return e
+
+
+class ImportTest(unittest.TestCase):
+    """Importing the validator must stay cheap for --help and early exits."""
+    
+    def test_heavy_modules_are_not_imported_up_front(self):
+        code = (
+            "import sys, validate_skills; "
+            "print(' '.join(m for m in ('yaml', 'argparse', 'threading', "
+            "'concurrent.futures') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        )
+        self.assertEqual(result.stdout.strip(), '')
+
+
+class ParseFlatYamlTest(unittest.TestCase):
+    """The flat fast path must agree with PyYAML whenever it answers."""
+    
+    def _loaders(self):
+        loaders = [yaml.SafeLoader]
+        if hasattr(yaml, 'CSafeLoader'):
+            loaders.append(yaml.CSafeLoader)
+        return loaders
+    
+    def assertMatchesYaml(self, text):
+        result = validate_skills._parse_flat_yaml(text)
+        if result is None:
+            return
+        for loader in self._loaders():
+            self.assertEqual(
+                result, _yaml_load(text, loader),
+                f"{loader.__name__} disagrees on {text!r}"
+            )
+    
+    def test_tricky_lines(self):
+        for line in TRICKY_LINES:
+            with self.subTest(line=line):
+                self.assertMatchesYaml(line)
+    
+    def test_random_frontmatter(self):
+        rng = random.Random(0)
+        for _ in range(20000):
+            text = '\n'.join(
+                rng.choice(TRICKY_LINES) + rng.choice(['', ' ', '\xa0', 'x'])
+                for _ in range(rng.randint(1, 4))
+            )
+            with self.subTest(text=text):
+                self.assertMatchesYaml(text)
+    
+    def test_repo_skills_take_fast_path(self):
+        paths = sorted(REPO_ROOT.glob('skills/*/SKILL.md'))
+        paths.append(REPO_ROOT / 'template' / 'SKILL.md')
+        for path in paths:
+            with self.subTest(path=path):
+                content = path.read_text(encoding='utf-8')
+                raw = validate_skills._split_frontmatter(content)
+                self.assertIsNotNone(validate_skills._parse_flat_yaml(raw))
+                self.assertMatchesYaml(raw)
+    
+    def test_rejects_non_yaml_whitespace(self):
+        for text in ('name: foo\xa0', 'version: 1.0.0　', 'description: 　'):
+            with self.subTest(text=text):
+                self.assertIsNone(validate_skills._parse_flat_yaml(text))
+
+
+class CheckSkillTest(unittest.TestCase):
+    """End-to-end checks of a single SKILL.md."""
+    
+    FRONTMATTER = b"---\nname: my-skill\ndescription: d\nversion: 1.0.0\n---\n"
+    
+    def _check(self, content: bytes):
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_file = Path(tmp) / 'my-skill' / 'SKILL.md'
+            skill_file.parent.mkdir()
+            skill_file.write_bytes(content)
+            validator = validate_skills.SkillValidator(tmp)
+            valid = validator.validate_skill(skill_file, 'my-skill')
+        return valid, [message for _, message in validator.errors]
+    
+    def test_constructor_error_is_invalid_yaml(self):
+        valid, errors = self._check(
+            b"---\nname: my-skill\ndescription: d\nversion: 2020-13-01\n---\n"
+        )
+        self.assertFalse(valid)
+        self.assertEqual(len(errors), 1)
+        self.assertTrue(errors[0].startswith("Invalid YAML in frontmatter"))
+    
+    def test_non_string_version_is_shown_as_written(self):
+        valid, errors = self._check(
+            b"---\nname: my-skill\ndescription: d\nversion: 2020-01-01\n---\n"
+        )
+        self.assertFalse(valid)
+        self.assertTrue(errors[0].startswith("Version '2020-01-01' must be a string"))
+    
+    def test_decode_error_position_is_from_file_start(self):
+        prefix = self.FRONTMATTER + b"# Title\n" + b"x" * 10000 + b"\n"
+        valid, errors = self._check(prefix + b"\xff\n")
+        self.assertFalse(valid)
+        self.assertIn(f"position {len(prefix)}:", errors[0])
+    
+    def test_decode_error_after_sections_is_reported(self):
+        content = self.FRONTMATTER + (
+            b"# Title\n## Overview\n## Instructions\n## Examples\n\xff\n"
+        )
+        valid, errors = self._check(content)
+        self.assertFalse(valid)
+        self.assertTrue(errors[0].startswith("Failed to read file"))
+    
+    def test_valid_skill(self):
+        content = self.FRONTMATTER + (
+            b"# Title\r\n## Overview\r\n## Instructions\r\n## Examples\r\n"
+        )
+        self.assertEqual(self._check(content), (True, []))
+
+
+class ValidateAllTest(unittest.TestCase):
+    """Checks over a whole skills directory."""
+    
+    @unittest.skipUnless(hasattr(os, 'symlink'), "needs symlink support")
+    def test_follows_symlinked_skill_dirs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            real = Path(tmp) / 'real' / 'linked'
+            real.mkdir(parents=True)
+            (real / 'SKILL.md').write_text(
+                "---\nname: linked\ndescription: d\nversion: 1.0\n---\n# T\n",
+                encoding='utf-8',
+            )
+            skills = Path(tmp) / 'skills'
+            skills.mkdir()
+            (skills / 'linked').symlink_to(real, target_is_directory=True)
+            
+            validator = validate_skills.SkillValidator(str(skills))
+            self.assertFalse(validator.validate_all())
+            self.assertEqual(len(validator.errors), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,200 +9,422 @@ This script validates SKILL.md files to ensure they follow the Anthropic skills
 - Required sections in markdown
 """
 
+import os
 import sys
 import re
-import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+
+RECOMMENDED_SECTIONS = ('Overview', 'Instructions', 'Examples')
+
+# Plain scalars starting with one of these, or spelling one of the keywords,
+# mean something other than a string to YAML
+_YAML_INDICATORS = frozenset('-?:,[]{}#&*!|>\'"%@`+.~<=')
+_YAML_KEYWORDS = frozenset((
+    'y', 'n', 'yes', 'no', 'true', 'false', 'on', 'off', 'null', '~',
+))
+
+# Sentinel for frontmatter lookups, so absent and null fields can be told apart
+_MISSING = object()
+
+# A validation message and the file it is about (None when it is not about a
+# single file); the two are only joined when printed
+Issue = Tuple[Optional[Path], str]
+
+# (errors, warnings, skill name if the skill passed validation)
+SkillResult = Tuple[List[Issue], List[Issue], Optional[str]]
+
+
+@lru_cache(maxsize=None)
+def _get_yaml():
+    """Import PyYAML on first use so --help and early exits skip it.
+    
+    Returns the yaml module and its fastest safe loader (libyaml-backed
+    when PyYAML was built with it).
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return yaml, loader
+
+
+def _read_text(path: Path) -> str:
+    """Read a UTF-8 text file with a single read() sized from fstat().
+    
+    Skips the buffered text I/O stack; newlines are translated the same way
+    open() in text mode would.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        # Regular files come back whole; keep reading only on a short read
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        content = data.decode('utf-8')
+    finally:
+        os.close(fd)
+    
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _parse_flat_yaml(text: str) -> Optional[Dict]:
+    """Parse frontmatter made only of flat ``key: value`` string lines.
+    
+    Returns None for anything outside that subset (nesting, block scalars,
+    escapes, values YAML would not load as strings, ...) so the caller can
+    fall back to a real YAML parser; never guesses.
+    """
+    result = {}
+    for line in text.split('\n'):
+        # Reject tabs, control characters and non-ASCII whitespace before any
+        # stripping: YAML keeps some of them in values and refuses others
+        if not line.isprintable():
+            return None
+        line = line.rstrip(' ')
+        if not line or line.startswith('#'):
+            continue
+        if line[0] == ' ':
+            return None
+        
+        if line.endswith(':'):
+            key, value = line[:-1], ''
+        else:
+            key, sep, value = line.partition(': ')
+            if not sep:
+                return None
+            value = value.strip(' ')
+        key = key.rstrip(' ')
+        
+        if (
+            not key[:1].isalpha()
+            or not key.replace('-', '').replace('_', '').isalnum()
+            or key.lower() in _YAML_KEYWORDS
+        ):
+            return None
+        
+        if not value:
+            result[key] = None
+        elif value[0] in '\'"':
+            quote = value[0]
+            inner = value[1:-1]
+            if (
+                len(value) < 2
+                or value[-1] != quote
+                or quote in inner
+                or (quote == '"' and '\\' in inner)
+            ):
+                return None
+            result[key] = inner
+        elif (
+            value[0] in _YAML_INDICATORS
+            or value.endswith(':')
+            or ': ' in value
+            or ' #' in value
+            or value.lower() in _YAML_KEYWORDS
+            # Numbers and dates start with a digit and carry at most one
+            # '.', so anything else starting with a digit (e.g. 1.0.0) is
+            # still a plain string
+            or (value[0].isdigit() and value.count('.') < 2)
+        ):
+            return None
+        else:
+            result[key] = value
+    
+    return result or None
+
+
+def _has_line_prefix(text: str, prefix: str) -> bool:
+    """Return True if any line of ``text`` starts with ``prefix``."""
+    return text.startswith(prefix) or f'\n{prefix}' in text
+
+
+def _has_main_heading(text: str) -> bool:
+    """Return True if ``text`` has a '# Title' line with a non-empty title."""
+    if text.startswith('# ') and text[2:3] not in ('', '\n'):
+        return True
+    pos = text.find('\n# ')
+    while pos != -1:
+        if text[pos + 3:pos + 4] not in ('', '\n'):
+            return True
+        pos = text.find('\n# ', pos + 1)
+    return False
+
+
+def _split_frontmatter(content: str) -> Optional[str]:
+    """Return the raw text between the leading ``---`` delimiters, if any.
+
+    Frontmatter always starts at the top of the file, so a couple of plain
+    string searches find it without the regex engine walking the body.
+    """
+    if not content.startswith('---'):
+        return None
+    
+    # Opening delimiter may carry trailing whitespace
+    start = content.find('\n', 3)
+    if start == -1 or content[3:start].strip():
+        return None
+    
+    # Closing delimiter is the first '---' line, which may also end the file
+    pos = start
+    while True:
+        pos = content.find('\n---', pos + 1)
+        if pos == -1:
+            return None
+        line_end = content.find('\n', pos + 4)
+        if line_end == -1:
+            line_end = len(content)
+        if not content[pos + 4:line_end].strip():
+            return content[start + 1:pos]
 
 
 class SkillValidator:
     """Validates skill files according to the Anthropic pattern."""
     
-    REQUIRED_FIELDS = ['name', 'description', 'version']
+    __slots__ = ('skills_dir', 'errors', 'warnings', 'skill_names')
+    
+    REQUIRED_FIELDS = ('name', 'description', 'version')
     SEMVER_PATTERN = r'^\d+\.\d+\.\d+$'
+    MAX_VERSION_LENGTH = 64
+    
+    # Compiled once with the class, shared by every validator instance;
+    # ASCII-only so \d does not accept other scripts' digits
+    _RE_SEMVER = re.compile(SEMVER_PATTERN, re.ASCII)
+    _RE_NAME = re.compile(r'^[a-z][a-z0-9-]*$', re.ASCII)
     
     def __init__(self, skills_dir: str = 'skills'):
         self.skills_dir = Path(skills_dir)
-        self.errors: List[str] = []
-        self.warnings: List[str] = []
-        self.skill_names: set = set()
+        self.errors: List[Issue] = []
+        self.warnings: List[Issue] = []
+        # Skill name -> file it was first seen in
+        self.skill_names: Dict[str, Path] = {}
     
     def validate_all(self) -> bool:
         """Validate all skills in the skills directory."""
-        if not self.skills_dir.exists():
-            self.errors.append(f"Skills directory not found: {self.skills_dir}")
+        # DirEntry.is_dir() answers from the cached directory listing, so
+        # only symlinked entries cost an extra stat() to follow
+        try:
+            with os.scandir(self.skills_dir) as it:
+                skill_dirs = [e for e in it if e.is_dir()]
+        except (FileNotFoundError, NotADirectoryError):
+            self.errors.append((None, f"Skills directory not found: {self.skills_dir}"))
             return False
         
-        skill_dirs = [d for d in self.skills_dir.iterdir() if d.is_dir()]
-        
         if not skill_dirs:
-            self.warnings.append("No skills found in skills directory")
+            self.warnings.append((None, "No skills found in skills directory"))
             return True
         
         success = True
         for skill_dir in skill_dirs:
-            skill_file = skill_dir / 'SKILL.md'
-            if not skill_file.exists():
-                self.errors.append(f"Missing SKILL.md in {skill_dir.name}")
-                success = False
-                continue
-            
+            skill_file = Path(os.path.join(skill_dir.path, 'SKILL.md'))
             if not self.validate_skill(skill_file, skill_dir.name):
                 success = False
         
-        # Check for duplicate names
-        if not self._check_unique_names():
-            success = False
-        
         return success
     
     def validate_skill(self, skill_file: Path, dir_name: str) -> bool:
         """Validate a single skill file."""
+        return self._merge_result(skill_file, self._check_skill(skill_file, dir_name))
+    
+    def _merge_result(self, skill_file: Path, result: SkillResult) -> bool:
+        """Record the outcome of _check_skill on the validator."""
+        errors, warnings, name = result
+        self.errors.extend(errors)
+        self.warnings.extend(warnings)
+        if name is None:
+            return False
+        
+        # Directory names already make skill names unique, but a skill
+        # validated directly through validate_skill could still collide
+        existing = self.skill_names.setdefault(name, skill_file)
+        if existing != skill_file:
+            self.errors.append((
+                skill_file,
+                f"Duplicate skill name '{name}' (already used by {existing})"
+            ))
+            return False
+        return True
+    
+    def _check_skill(self, skill_file: Path, dir_name: str) -> SkillResult:
+        """Check a single skill file without touching validator state.
+        
+        Returns the errors and warnings found, plus the skill name if the
+        file passed validation (None otherwise).
+        """
         try:
-            with open(skill_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = _read_text(skill_file)
+        except FileNotFoundError:
+            return [(None, f"Missing SKILL.md in {dir_name}")], [], None
         except Exception as e:
-            self.errors.append(f"{skill_file}: Failed to read file - {e}")
-            return False
+            return [(skill_file, f"Failed to read file - {e}")], [], None
         
         # Extract and validate frontmatter
-        frontmatter = self._extract_frontmatter(content, skill_file)
-        if frontmatter is None:
-            return False
+        frontmatter, errors = self._extract_frontmatter(content, skill_file)
+        if errors:
+            return errors, [], None
         
         # Validate required fields
-        if not self._validate_required_fields(frontmatter, skill_file):
-            return False
+        errors = self._validate_required_fields(frontmatter, skill_file)
+        if errors:
+            return errors, [], None
         
         # Validate name format
-        if not self._validate_name_format(frontmatter['name'], skill_file):
-            return False
+        name = frontmatter['name']
+        errors = self._validate_name_format(name, skill_file)
+        if errors:
+            return errors, [], None
         
         # Validate name matches directory
-        if frontmatter['name'] != dir_name:
-            self.errors.append(
-                f"{skill_file}: Skill name '{frontmatter['name']}' "
-                f"doesn't match directory name '{dir_name}'"
-            )
-            return False
+        if name != dir_name:
+            return [(
+                skill_file,
+                f"Skill name '{name}' doesn't match directory name '{dir_name}'"
+            )], [], None
         
         # Validate version format
-        if not self._validate_version(frontmatter['version'], skill_file):
-            return False
-        
-        # Track skill name for duplicate check
-        self.skill_names.add(frontmatter['name'])
+        errors = self._validate_version(frontmatter['version'], skill_file)
+        if errors:
+            return errors, [], None
         
         # Validate markdown structure
-        self._validate_markdown_structure(content, skill_file)
+        warnings = self._validate_markdown_structure(content, skill_file)
         
-        return True
+        return [], warnings, name
     
-    def _extract_frontmatter(self, content: str, skill_file: Path) -> Optional[Dict]:
-        """Extract YAML frontmatter from markdown content."""
-        # Match YAML frontmatter between --- delimiters
-        # Flexible pattern that handles optional trailing newline
-        match = re.match(r'^---\s*\n(.*?)\n---\s*(?:\n|$)', content, re.DOTALL)
+    def _extract_frontmatter(
+        self, content: str, skill_file: Path
+    ) -> Tuple[Optional[Dict], List[Issue]]:
+        """Extract YAML frontmatter from markdown content.
         
-        if not match:
-            self.errors.append(f"{skill_file}: Missing or invalid YAML frontmatter")
-            return None
+        Returns the parsed frontmatter, or None and the errors explaining why
+        it could not be extracted.
+        """
+        raw = _split_frontmatter(content)
+        
+        if raw is None:
+            return None, [(skill_file, "Missing or invalid YAML frontmatter")]
         
+        # Typical frontmatter is a few flat "key: value" lines; only hand
+        # anything fancier to PyYAML
+        frontmatter = _parse_flat_yaml(raw)
+        if frontmatter is not None:
+            return frontmatter, []
+        
+        yaml, loader = _get_yaml()
         try:
-            frontmatter = yaml.safe_load(match.group(1))
-            if not isinstance(frontmatter, dict):
-                self.errors.append(f"{skill_file}: Frontmatter is not a valid YAML object")
-                return None
-            return frontmatter
-        except yaml.YAMLError as e:
-            self.errors.append(f"{skill_file}: Invalid YAML in frontmatter - {e}")
-            return None
+            frontmatter = yaml.load(raw, Loader=loader)
+        except (yaml.YAMLError, ValueError) as e:
+            # Constructors raise ValueError too, e.g. for a date like 2020-13-01
+            return None, [(skill_file, f"Invalid YAML in frontmatter - {e}")]
+        
+        if not isinstance(frontmatter, dict):
+            return None, [(skill_file, "Frontmatter is not a valid YAML object")]
+        return frontmatter, []
     
-    def _validate_required_fields(self, frontmatter: Dict, skill_file: Path) -> bool:
-        """Validate that all required fields are present."""
-        missing = [f for f in self.REQUIRED_FIELDS if f not in frontmatter]
+    def _validate_required_fields(
+        self, frontmatter: Dict, skill_file: Path
+    ) -> List[Issue]:
+        """Validate that all required fields are present and non-empty."""
+        missing = []
+        empty = []
+        for field in self.REQUIRED_FIELDS:
+            value = frontmatter.get(field, _MISSING)
+            if value is _MISSING:
+                missing.append(field)
+            elif not value:
+                empty.append(field)
+        
+        errors = []
         if missing:
-            self.errors.append(
-                f"{skill_file}: Missing required fields: {', '.join(missing)}"
-            )
-            return False
+            errors.append((
+                skill_file,
+                f"Missing required fields: {', '.join(missing)}"
+            ))
         
-        # Check for empty values
-        empty = [f for f in self.REQUIRED_FIELDS if not frontmatter[f]]
         if empty:
-            self.errors.append(
-                f"{skill_file}: Empty values for: {', '.join(empty)}"
-            )
-            return False
+            errors.append((
+                skill_file,
+                f"Empty values for: {', '.join(empty)}"
+            ))
         
-        return True
+        return errors
     
-    def _validate_name_format(self, name: str, skill_file: Path) -> bool:
+    def _validate_name_format(self, name: str, skill_file: Path) -> List[Issue]:
         """Validate skill name format (lowercase with hyphens)."""
-        if not re.match(r'^[a-z][a-z0-9-]*$', name):
-            self.errors.append(
-                f"{skill_file}: Skill name '{name}' must be lowercase "
+        if not self._RE_NAME.match(name):
+            return [(
+                skill_file,
+                f"Skill name '{name}' must be lowercase "
                 "with hyphens (e.g., 'my-skill-name')"
-            )
-            return False
-        return True
+            )]
+        return []
     
-    def _validate_version(self, version: str, skill_file: Path) -> bool:
+    def _validate_version(self, version: str, skill_file: Path) -> List[Issue]:
         """Validate semantic version format."""
+        # Unquoted values like 1.0 load as floats; reject rather than coerce
         if not isinstance(version, str):
-            version = str(version)
+            return [(
+                skill_file,
+                f"Version '{version}' must be a string following "
+                "semantic versioning (e.g., '1.0.0')"
+            )]
         
-        if not re.match(self.SEMVER_PATTERN, version):
-            self.errors.append(
-                f"{skill_file}: Version '{version}' must follow semantic "
+        # Bound the length before handing untrusted input to the regex
+        if len(version) > self.MAX_VERSION_LENGTH:
+            return [(
+                skill_file,
+                "Version is longer than "
+                f"{self.MAX_VERSION_LENGTH} characters"
+            )]
+        
+        if not self._RE_SEMVER.match(version):
+            return [(
+                skill_file,
+                f"Version '{version}' must follow semantic "
                 "versioning (e.g., '1.0.0')"
-            )
-            return False
-        return True
+            )]
+        return []
     
-    def _validate_markdown_structure(self, content: str, skill_file: Path) -> None:
+    def _validate_markdown_structure(
+        self, content: str, skill_file: Path
+    ) -> List[Issue]:
         """Validate markdown structure and provide recommendations."""
-        # Check for main heading
-        if not re.search(r'^# .+$', content, re.MULTILINE):
-            self.warnings.append(f"{skill_file}: Missing main heading (# Title)")
-        
-        # Check for common sections
-        recommended_sections = ['Overview', 'Instructions', 'Examples']
-        for section in recommended_sections:
-            if not re.search(rf'^## {section}', content, re.MULTILINE):
-                self.warnings.append(
-                    f"{skill_file}: Recommended section '## {section}' not found"
-                )
-    
-    def _check_unique_names(self) -> bool:
-        """Check for duplicate skill names."""
-        # Directory structure enforces uniqueness, but we verify anyway
-        # This would only catch errors if someone manually edits skill names
-        # without renaming directories
-        name_counts = {}
-        for name in self.skill_names:
-            name_counts[name] = name_counts.get(name, 0) + 1
-        
-        duplicates = [name for name, count in name_counts.items() if count > 1]
-        if duplicates:
-            self.errors.append(
-                f"Duplicate skill names found: {', '.join(duplicates)}"
-            )
-            return False
-        return True
+        warnings = []
+        
+        # Headings are literal line prefixes, so C-level substring searches
+        # find them and stop at the first match
+        if not _has_main_heading(content):
+            warnings.append((skill_file, "Missing main heading (# Title)"))
+        
+        for section in RECOMMENDED_SECTIONS:
+            if not _has_line_prefix(content, f'## {section}'):
+                warnings.append((
+                    skill_file,
+                    f"Recommended section '## {section}' not found"
+                ))
+        
+        return warnings
     
     def print_results(self) -> None:
         """Print validation results."""
         if self.errors:
             print("\n❌ ERRORS:")
-            for error in self.errors:
-                print(f"  {error}")
+            for issue in self.errors:
+                print(f"  {_format_issue(issue)}")
         
         if self.warnings:
             print("\n⚠️  WARNINGS:")
-            for warning in self.warnings:
-                print(f"  {warning}")
+            for issue in self.warnings:
+                print(f"  {_format_issue(issue)}")
         
         if not self.errors and not self.warnings:
             print("✅ All skills validated successfully!")
@@ -212,6 +434,12 @@ class SkillValidator:
             print(f"\n❌ Validation failed with {len(self.errors)} error(s)")
 
 
+def _format_issue(issue: Issue) -> str:
+    """Format an issue for output, prefixed with its file if it has one."""
+    path, message = issue
+    return message if path is None else f"{path}: {message}"
+
+
 def main():
     """Main entry point for the validator."""
     import argparse